@@ -69,3 +69,11 @@ IMPORTANT_KEYWORDS = {
     # Critical Scenarios
     'doomsday': 5, 'apocalypse': 5, 'existential threat': 5,
 }
+
+# Keywords that can occur in lower-cased article text, with their weights.
+# Mixed-case keywords such as 'US' or 'AI' can never match there, so the
+# content scan skips them instead of testing them against every article.
+CONTENT_KEYWORDS = tuple(
+    (keyword, weight) for keyword, weight in IMPORTANT_KEYWORDS.items()
+    if keyword == keyword.lower()
+)
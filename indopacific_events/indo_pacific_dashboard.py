@@ -1,18 +1,28 @@
 import streamlit as st
 import feedparser
 import requests
+from requests.adapters import HTTPAdapter
 from PIL import Image
 from io import BytesIO
 import datetime
 import os
+import logging
+import time
 from bs4 import BeautifulSoup
 import nltk
 from nltk.corpus import stopwords
 from nltk.tokenize import word_tokenize, sent_tokenize
 from collections import Counter
+import heapq
+from itertools import islice
+from concurrent.futures import ThreadPoolExecutor
 import ssl
+from importlib.util import find_spec
 
-from importance_keywords import IMPORTANT_KEYWORDS  # Import the keywords
+from importance_keywords import IMPORTANT_KEYWORDS, CONTENT_KEYWORDS  # Import the keywords
+from rss_sources import RSS_FEEDS, SOURCE_NAMES  # Import the feed list
+
+logger = logging.getLogger(__name__)
 
 # Disable SSL verification (only if necessary)
 try:
@@ -22,6 +32,9 @@ except AttributeError:
 else:
     ssl._create_default_https_context = _create_unverified_https_context
 
+# Use lxml's C parser for HTML when it's installed, otherwise the built-in one
+HTML_PARSER = "lxml" if find_spec("lxml") else "html.parser"
+
 
 # Function to download NLTK data if not already present
 def download_nltk_data():
@@ -41,61 +54,229 @@ SCRIPT_DIR = os.path.dirname(os.path.abspath(__file__))
 FILLER_IMAGE_PATH = os.path.join(SCRIPT_DIR, "indo_pacific_filler_pic.jfif")
 
 
-# Function to fetch and parse RSS feeds
-@st.cache_data(ttl=3600)  # Cache for 1 hour
-def fetch_rss_feed(url):
-    return feedparser.parse(url)
+# Max number of feeds and images downloaded at the same time
+MAX_DOWNLOAD_WORKERS = 16
+
+# Seconds to wait on a feed or image server before giving up
+REQUEST_TIMEOUT = 10
+
+# Number of article cards rendered per page
+ARTICLES_PER_PAGE = 20
+
+# Largest size article images are kept at; the image column is far narrower
+MAX_IMAGE_SIZE = (1000, 1000)
+
+# Seconds a downloaded article image is kept before it's fetched again
+IMAGE_TTL = 3600
+
+# Max number of downloaded article images kept in memory
+MAX_CACHED_IMAGES = 1024
+
+# Max number of entries analysed per feed; feeds list newest first, so this
+# skips old archive items nobody pages back to
+MAX_ENTRIES_PER_FEED = 50
+
+# Empty feed shown for any source that fails to download, shared rather than
+# rebuilt per failure since cached feeds are never modified
+EMPTY_FEED = feedparser.FeedParserDict(entries=[])
+
+
+# Function to create one HTTP session shared by all feed and image downloads
+# so requests to the same host reuse open connections
+@st.cache_resource
+def get_http_session():
+    session = requests.Session()
+    adapter = HTTPAdapter(pool_connections=32, pool_maxsize=32)
+    session.mount('https://', adapter)
+    session.mount('http://', adapter)
+    return session
+
+
+# Function to keep each feed's ETag, Last-Modified and last parsed result, keyed by URL
+@st.cache_resource
+def get_feed_validators():
+    return {}
+
+
+# Function to create one thread pool for feed and image downloads, kept alive between
+# fetches instead of starting and joining new threads on every cache miss
+@st.cache_resource
+def get_download_executor():
+    return ThreadPoolExecutor(max_workers=MAX_DOWNLOAD_WORKERS, thread_name_prefix='download')
+
+
+# Function to download one feed over the shared session and parse it
+# Sends a conditional GET so unchanged feeds come back as an empty 304
+def fetch_feed(session, url, validators):
+    headers = {}
+    cached = validators.get(url)
+    if cached:
+        etag, modified, _ = cached
+        if etag:
+            headers['If-None-Match'] = etag
+        if modified:
+            headers['If-Modified-Since'] = modified
+    response = session.get(url, headers=headers, timeout=REQUEST_TIMEOUT)
+    # Not modified since the last fetch, so reuse the feed parsed then
+    if response.status_code == 304 and cached:
+        return cached[2]
+    response.raise_for_status()
+    # clean_html strips the markup afterwards, so skip feedparser's own
+    # HTML sanitizing and relative-URI rewriting of every entry
+    feed = feedparser.parse(response.content, sanitize_html=False,
+                            resolve_relative_uris=False)
+    validators[url] = (response.headers.get('ETag'),
+                       response.headers.get('Last-Modified'), feed)
+    return feed
+
+
+# Function to fetch one feed for the thread pool, falling back to the last good parse
+# (or an empty feed if there is none) so one broken feed doesn't take down the others
+def fetch_feed_or_empty(session, url, validators):
+    try:
+        return fetch_feed(session, url, validators)
+    except Exception as e:
+        logger.warning("Could not fetch feed %s: %s", url, e)
+        cached = validators.get(url)
+        return cached[2] if cached else EMPTY_FEED
+
+
+# Function to fetch and parse RSS feeds in parallel, keyed by source name
+# Cached as a shared resource so the parsed feeds aren't pickled and copied on every
+# call; callers must treat the result as read-only
+# The page already shows its own spinner while articles load
+@st.cache_resource(ttl=3600, show_spinner=False)  # Cache for 1 hour
+def fetch_rss_feeds(feeds):
+    session = get_http_session()
+    validators = get_feed_validators()
+    # Download each distinct URL once, even if several sources point at it
+    urls = list(dict.fromkeys(url for url, _ in feeds))
+    # Feeds still download in parallel; map just hands results back in URL order
+    results = get_download_executor().map(
+        lambda url: fetch_feed_or_empty(session, url, validators), urls)
+    feeds_by_url = dict(zip(urls, results))
+    return {source_name: feeds_by_url[url] for url, source_name in feeds}
+
+
+# Function to load the filler image once instead of reading it from disk per article
+@st.cache_resource
+def get_filler_image():
+    img = Image.open(FILLER_IMAGE_PATH)
+    img.load()
+    return img
 
 
 # Function to get image from URL
-@st.cache_data(ttl=3600)  # Cache for 1 hour
-def get_image(url):
+# Runs on the download pool, so the session and filler image are passed in
+def download_image(session, url, filler):
     try:
-        response = requests.get(url)
+        response = session.get(url, timeout=REQUEST_TIMEOUT)
         img = Image.open(BytesIO(response.content))
+        # Let large JPEGs decode at a reduced scale rather than at full size
+        img.draft('RGB', MAX_IMAGE_SIZE)
+        # Decode here on the pool, so broken images fall back to the filler and
+        # nothing lazy is left for the script thread or other sessions to load
+        img.load()
+        img.thumbnail(MAX_IMAGE_SIZE)
         return img
-    except:
-        # Return the filler image if the URL image can't be fetched
-        return Image.open(FILLER_IMAGE_PATH)
-
-
-# Function to generate tags
-def generate_tags(content, num_tags=5):
-    # Remove HTML tags
-    text = BeautifulSoup(content, "html.parser").get_text()
-
+    except (requests.RequestException, OSError) as e:
+        # Expected failures (network errors, unreadable images) only get a one-line warning
+        # Lazy %-formatting so nothing is built when warnings are filtered out
+        logger.warning("Could not fetch image from %s: %s", url, e)
+    except Exception:
+        logger.exception("Unexpected error fetching image from %s", url)
+    # Return the filler image if the URL image can't be fetched
+    return filler
+
+
+# Function to keep downloaded article images and when they were fetched, keyed by URL
+@st.cache_resource
+def get_image_cache():
+    return {}
+
+
+# Function to get the images for one page of articles, keyed by URL
+# Only images not already cached are downloaded, in parallel, so a page of cards
+# waits on the slowest new image rather than the sum of them all
+def get_images(urls):
+    cache = get_image_cache()
+    now = time.monotonic()
+    images = {}
+    missing = []
+    for url in urls:
+        cached = cache.get(url)
+        if cached and now - cached[0] < IMAGE_TTL:
+            images[url] = cached[1]
+        else:
+            missing.append(url)
+    if missing:
+        session = get_http_session()
+        filler = get_filler_image()
+        downloaded = get_download_executor().map(
+            lambda url: download_image(session, url, filler), missing)
+        for url, img in zip(missing, downloaded):
+            images[url] = img
+            # Re-insert so the cache stays ordered oldest fetch first
+            cache.pop(url, None)
+            cache[url] = (now, img)
+        # Drop the oldest images once the cache is over its bound
+        excess = len(cache) - MAX_CACHED_IMAGES
+        if excess > 0:
+            for url in list(cache)[:excess]:
+                cache.pop(url, None)
+    return images
+
+
+# Function to load the English stopwords once instead of once per article
+@st.cache_resource
+def get_stop_words():
+    return frozenset(stopwords.words('english'))
+
+
+# Function to remove HTML tags, done once per article and shared by tags and summary
+def clean_html(content):
+    # Plain-text summaries have no tags or entities, so skip building a parse tree
+    if '<' not in content and '&' not in content:
+        return content
+    return BeautifulSoup(content, HTML_PARSER).get_text()
+
+
+# Function to generate tags from cleaned text
+def generate_tags(text, num_tags=5):
     # Tokenize and remove stopwords
-    stop_words = set(stopwords.words('english'))
-    words = [word.lower() for word in word_tokenize(
-        text) if word.isalnum() and word.lower() not in stop_words]
+    stop_words = get_stop_words()
+    words = [word for word in (token.lower() for token in word_tokenize(text))
+             if word.isalnum() and word not in stop_words]
 
     # Get most common words as tags
     return [word for word, _ in Counter(words).most_common(num_tags)]
 
 
-# Function to generate a summary
-def generate_summary(content, num_sentences=3):
-    # Remove HTML tags
-    text = BeautifulSoup(content, "html.parser").get_text()
-
+# Function to generate a summary from cleaned text
+def generate_summary(text, num_sentences=3):
     # Split into sentences and return first n sentences
     sentences = sent_tokenize(text)
     return ' '.join(sentences[:num_sentences])
 
+# Function to turn a feed's parsed date into a datetime, falling back to now
+def to_datetime(parsed, now):
+    if parsed and len(parsed) >= 6:
+        return datetime.datetime(*parsed[:6])
+    return now
+
 # Function used to rate importance of articles
 def rate_importance(content, tags):
     score = 0
     content_lower = content.lower()
 
     # Check for keywords in content
-    for keyword, weight in IMPORTANT_KEYWORDS.items():
+    for keyword, weight in CONTENT_KEYWORDS:
         if keyword in content_lower:
             score += weight
 
     # Check for keywords in tags
     for tag in tags:
-        if tag in IMPORTANT_KEYWORDS:
-            score += IMPORTANT_KEYWORDS[tag]
+        score += IMPORTANT_KEYWORDS.get(tag, 0)
 
     # Additional checks (weights increased)
     if any(word in content_lower for word in ['plan', 'prepare', 'strategy']) and 'disaster' in content_lower:
@@ -117,6 +298,58 @@ def rate_importance(content, tags):
     return normalized_score
 
 
+# Function to get the tags, summary and importance of an article's content
+# Cached on the content itself, so articles unchanged by a feed refresh aren't re-analysed
+# Bounded so old articles don't pile up, and returns only flat tuples and strings
+@st.cache_data(ttl=3600, max_entries=1024, show_spinner=False)  # Cache for 1 hour
+def analyze_content(content):
+    text = clean_html(content)
+    tags = tuple(generate_tags(text))
+    return tags, generate_summary(text), rate_importance(content, tags)
+
+
+# Function to build the articles for the selected feeds
+# Cached so reruns from sorting or searching skip tagging and scoring
+@st.cache_data(ttl=3600, show_spinner=False)  # Cache for 1 hour
+def load_articles(feeds):
+    # Always fetch every configured feed so the download cache has one entry,
+    # and changing the selected sources never goes back to the network
+    feeds_data = fetch_rss_feeds(RSS_FEEDS)
+    now = datetime.datetime.now()
+    articles = []
+    # Links already seen, so stories syndicated across feeds are only processed once
+    seen_links = set()
+    for feed_url, source_name in feeds:
+        feed = feeds_data[source_name]
+        for entry in islice(feed.entries, MAX_ENTRIES_PER_FEED):
+            link = entry.get('link')
+            if link in seen_links:
+                continue
+            if link:
+                seen_links.add(link)
+            tags, summary, importance = analyze_content(entry.get('summary', ''))
+            # Read media_content once, and use get so an entry without a title doesn't raise
+            media_content = entry.get('media_content')
+            articles.append({
+                'title': entry.get('title', ''),
+                'link': link,
+                'date': to_datetime(entry.get('published_parsed')
+                                    or entry.get('updated_parsed'), now),
+                'summary': summary,
+                'tags': tags,
+                'importance': importance,
+                'source': source_name,  # Use the source name here
+                'image_url': media_content[0]['url'] if media_content else None
+            })
+    return articles
+
+
+# Callback to drop the cached feeds and articles so downloaded images stay cached
+def refresh_feeds():
+    fetch_rss_feeds.clear()
+    load_articles.clear()
+
+
 # Set page title
 st.set_page_config(
     page_title="Indo-Pacific Current Events", layout="wide")
@@ -124,61 +357,55 @@ st.set_page_config(
 # Title
 st.title("Indo-Pacific Current Events")
 
-rss_feeds = [
-    ("https://www.eastasiaforum.org/feed/", "East Asia Forum"),
-    ("https://thediplomat.com/feed/", "The Diplomat"),
-    ("https://www.lowyinstitute.org/the-interpreter/rss.xml", "The Interpreter")
-]
-
 # Sidebar for filters
 st.sidebar.header("Filters")
 selected_sources = st.sidebar.multiselect(
     "Select Sources",
-    [feed[1] for feed in rss_feeds]  # Use the website names
+    SOURCE_NAMES  # Use the website names
 )
 sort_by = st.sidebar.selectbox("Sort By", ["Date", "Importance"])
 search_term = st.sidebar.text_input("Search for keywords")
 
+st.sidebar.button("Refresh Feeds", on_click=refresh_feeds)
+
+# Sort keys, chosen once from the sidebar instead of compared per article
+SORT_KEYS = {
+    "Date": lambda x: x['date'],
+    "Importance": lambda x: x['importance'],
+}
+
 # Fetch all articles
 with st.spinner('Loading articles...'):
-    all_articles = []
-    for feed_url, source_name in rss_feeds:
-        if not selected_sources or source_name in selected_sources:
-            feed = fetch_rss_feed(feed_url)
-            for entry in feed.entries:
-                tags = generate_tags(entry.get('summary', ''))
-                summary = generate_summary(entry.get('summary', ''))
-                importance = rate_importance(entry.get('summary', ''), tags)
-                article = {
-                    'title': entry.title,
-                    'link': entry.link,
-                    'date': datetime.datetime(*entry.published_parsed[:6]),
-                    'summary': summary,
-                    'tags': tags,
-                    'importance': importance,
-                    'source': source_name,  # Use the source name here
-                    'image_url': entry.media_content[0]['url'] if 'media_content' in entry else None
-                }
-                if not search_term or search_term.lower() in str(article).lower():
-                    all_articles.append(article)
-
-    # Sort articles
-    if sort_by == "Date":
-        all_articles.sort(key=lambda x: x['date'], reverse=True)
-    else:
-        all_articles.sort(key=lambda x: x['importance'], reverse=True)
+    search_term_lower = search_term.lower()
+    active_feeds = tuple(feed for feed in RSS_FEEDS
+                         if not selected_sources or feed[1] in selected_sources)
+    all_articles = [article for article in load_articles(active_feeds)
+                    if not search_term_lower or search_term_lower in str(article).lower()]
 
 # After loading is complete
 st.success('Articles loaded successfully!')
 
+# Only render one page of articles so reruns don't rebuild every card and image
+num_pages = max(1, (len(all_articles) + ARTICLES_PER_PAGE - 1) // ARTICLES_PER_PAGE)
+page = st.sidebar.number_input("Page", min_value=1, max_value=num_pages, value=1)
+page_start = (page - 1) * ARTICLES_PER_PAGE
+page_end = page_start + ARTICLES_PER_PAGE
+
+# Sort articles, only ordering as many as are needed to reach the current page
+page_articles = heapq.nlargest(page_end, all_articles, key=SORT_KEYS[sort_by])[page_start:]
+
+# Fetch the page's images together before drawing the cards
+page_images = get_images(list(dict.fromkeys(
+    article['image_url'] for article in page_articles if article['image_url'])))
+
 # Display articles
-for article in all_articles:
+for article in page_articles:
     col1, col2 = st.columns([1, 3])
     with col1:
         if article['image_url']:
-            img = get_image(article['image_url'])
+            img = page_images[article['image_url']]
         else:
-            img = Image.open(FILLER_IMAGE_PATH)
+            img = get_filler_image()
         st.image(img, use_column_width=True)
 
     with col2:
@@ -0,0 +1,11 @@
+# rss_sources.py
+
+# (feed url, source name) pairs shown in the dashboard
+RSS_FEEDS = (
+    ("https://www.eastasiaforum.org/feed/", "East Asia Forum"),
+    ("https://thediplomat.com/feed/", "The Diplomat"),
+    ("https://www.lowyinstitute.org/the-interpreter/rss.xml", "The Interpreter"),
+)
+
+# Website names used for the source filter
+SOURCE_NAMES = tuple(source_name for _, source_name in RSS_FEEDS)
@@ -1,6 +1,5 @@
 import pandas as pd
 from PySide6.QtWidgets import QApplication, QLabel, QComboBox, QVBoxLayout, QWidget, QPushButton, QLineEdit, QFormLayout
-import numpy as np
 
 # Define the fake data frames
 df_ships = pd.DataFrame({
@@ -62,11 +61,9 @@ class ShipWeaponLoader(QWidget):
         info_text += f"Load Location: {ship_info['Load_Location']} ({ship_info['Load_Latitude']}, {ship_info['Load_Longitude']}) \n"
         self.ship_info_display.setText(info_text)
         self.available_space_label.setText(
-            f'Available Space: {self.calculate_available_space()} units')
+            f'Available Space: {self.calculate_available_space(ship_info)} units')
 
-    def calculate_available_space(self):
-        selected_ship = self.ship_select_combo.currentText()
-        ship_info = df_ships[df_ships['Ship_Name'] == selected_ship].squeeze()
+    def calculate_available_space(self, ship_info):
         loaded_space = sum(count * df_weapons.loc[df_weapons['Weapon_Type'] == weapon,
                            'Weapon_Space'].iloc[0] for weapon, count in ship_info['Loaded_Weapons'])
         available_space = ship_info["Ship_Total_Weapon_Space"] - loaded_space
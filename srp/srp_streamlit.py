@@ -6,7 +6,6 @@ import folium
 from streamlit_folium import folium_static
 # END edit here -------------------------------------
 
-import numpy as np
 import altair as alt
 from PIL import Image
 from math import radians, cos, sin, asin, sqrt
@@ -34,6 +33,13 @@ df_weapons = pd.DataFrame({
     'Country': ['USA', 'USA', 'USA', 'USA']
 })
 
+# Weapon space indexed by weapon type for vectorized lookups
+weapon_space_by_type = df_weapons.set_index('Weapon_Type')['Weapon_Space']
+
+# Load duration in seconds indexed by weapon type, parsed once for all weapons
+load_seconds_by_type = pd.to_timedelta(
+    df_weapons.set_index('Weapon_Type')['Weapon_Type_Load_Duration']).dt.total_seconds()
+
 df_ship_routes = pd.DataFrame({
     'Ship_Name': ['Sea Warrior', 'Liberty', 'Freedom', 'Independence', 'Defender'],
     'Load_Location': ['Pearl Harbor', 'San Diego', 'Norfolk', 'Yokosuka', 'Guam'],
@@ -110,6 +116,7 @@ def main():
     st.write(f'**Available Space:** {available_space} units')
     with st.expander("Expand to Add Weapons"):
         selected_weapons = {}
+        total_load_space = 0
         for index, row in df_weapons.iterrows():
             weapon_type = row['Weapon_Type']
             weapon_space = row['Weapon_Space']
@@ -119,13 +126,14 @@ def main():
                 f'{weapon_type} ({weapon_space} space)', min_value=0, max_value=max_count, value=0)
             selected_weapons[weapon_type] = selected_count
 
-            # Check if adding this weapon exceeds available space
-            total_load_space = sum(
-                selected_weapons[w] * df_weapons.loc[df_weapons['Weapon_Type'] == w, 'Weapon_Space'].iloc[0] for w in selected_weapons)
-            if total_load_space > available_space:
+            # Check if adding this weapon exceeds available space, keeping a running
+            # total rather than re-summing every weapon selected so far
+            if total_load_space + selected_count * weapon_space > available_space:
                 st.warning(
                     'Adding this weapon system exceeds the available space. Please adjust your selection.')
                 selected_weapons[weapon_type] = 0  # Reset the selected count
+            else:
+                total_load_space += selected_count * weapon_space
 
     # Calculate total loaded space
     total_loaded_space = sum(selected_weapons.values())
@@ -135,8 +143,8 @@ def main():
     st.write('---')
 
     # Display total load duration after adding new weapons
-    total_load_duration = sum(selected_count * pd.Timedelta(df_weapons.loc[df_weapons['Weapon_Type'] == weapon,
-                              'Weapon_Type_Load_Duration'].iloc[0]).total_seconds() for weapon, selected_count in selected_weapons.items())
+    total_load_duration = (pd.Series(selected_weapons, dtype=float)
+                           * load_seconds_by_type).sum()
     st.write('### Total Load Duration After Adding New Weapons')
     st.write(
         f'**Total Load Duration:** {pd.Timedelta(seconds=total_load_duration)}')
@@ -149,14 +157,18 @@ def main():
 
     # Create a dataframe for already loaded and newly added weapons
     loaded_dict = dict(ship_info['Loaded_Weapons'])
-    new_dict = {k: selected_weapons.get(k, 0) for k in set(
-        loaded_dict) | set(selected_weapons)}
-    total_dict = {k: loaded_dict.get(k, 0) + new_dict.get(k, 0)
-                  for k in set(loaded_dict) | set(new_dict)}
+    # Build all counts in a single pass over the weapon types, filling in 0
+    # for missing weapons up front so the table has no gaps to fill afterwards
+    already_dict = {}
+    new_dict = {}
+    total_dict = {}
+    for k in set(loaded_dict) | set(selected_weapons):
+        already_dict[k] = loaded_dict.get(k, 0)
+        new_dict[k] = selected_weapons.get(k, 0)
+        total_dict[k] = already_dict[k] + new_dict[k]
     df_combined = pd.DataFrame(
-        {'Already Loaded': loaded_dict, 'Newly Added': new_dict, 'Total': total_dict}).fillna(0)
-    df_combined['Weapon_Space'] = df_combined.index.map(
-        lambda x: df_weapons[df_weapons['Weapon_Type'] == x]['Weapon_Space'].iloc[0])
+        {'Already Loaded': already_dict, 'Newly Added': new_dict, 'Total': total_dict})
+    df_combined['Weapon_Space'] = df_combined.index.map(weapon_space_by_type)
     df_combined['Total Space'] = df_combined['Total'] * \
         df_combined['Weapon_Space']
 